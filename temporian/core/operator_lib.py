@@ -14,7 +14,7 @@
 
 """Registering mechanism for operator classes."""
 
-from typing import Any, Dict, Type
+from typing import Any, Dict, Iterable, Type
 
 from temporian.core.operators.base import Operator
 
@@ -24,10 +24,22 @@ _OPERATORS = {}
 def register_operator(operator_class: Type[Operator]):
     """Registers an operator."""
 
-    op_key = operator_class.operator_key()
-    if op_key in _OPERATORS:
-        raise ValueError("Operator already registered")
-    _OPERATORS[op_key] = operator_class
+    register_operators([operator_class])
+
+
+def register_operators(operator_classes: Iterable[Type[Operator]]):
+    """Registers multiple operators at once.
+
+    All the operators are checked before any of them is registered.
+    """
+
+    new_operators = {}
+    for operator_class in operator_classes:
+        op_key = operator_class.operator_key()
+        if op_key in _OPERATORS or op_key in new_operators:
+            raise ValueError("Operator already registered")
+        new_operators[op_key] = operator_class
+    _OPERATORS.update(new_operators)
 
 
 def get_operator_class(key: str):
@@ -40,6 +40,11 @@ AttributeType = Union[
 ]
 
 
+# Definitions of the operators, indexed by operator class. Filled by
+# Operator._cached_op_definition.
+_OP_DEFINITIONS: Dict[type, pb.OperatorDef] = {}
+
+
 class OperatorExceptionDecorator:
     """Adds details about an operator to exceptions raised in a block.
 
@@ -84,7 +89,7 @@ class Operator(ABC):
         self._inputs: Dict[str, EventSetNode] = {}
         self._outputs: Dict[str, EventSetNode] = {}
         self._attributes: Dict[str, AttributeType] = {}
-        self._definition: pb.OperatorDef = self.build_op_definition()
+        self._definition: pb.OperatorDef = self._cached_op_definition()
         self._attr_types: Dict[str, type] = {
             attr.key: attr.type for attr in self._definition.attributes
         }
@@ -232,15 +237,29 @@ class Operator(ABC):
 
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
+        """Creates the definition of the operator.
+
+        The definition is built once per operator class and shared by all its
+        instances (see `definition`). Callers must never modify it.
+        """
         raise NotImplementedError()
 
+    @classmethod
+    def _cached_op_definition(cls) -> pb.OperatorDef:
+        """Gets the definition of the operator, building it on first call."""
+        definition = _OP_DEFINITIONS.get(cls)
+        if definition is None:
+            definition = cls.build_op_definition()
+            _OP_DEFINITIONS[cls] = definition
+        return definition
+
     @property
     def definition(self) -> pb.OperatorDef:
         return self._definition
 
     @classmethod
     def operator_key(cls) -> str:
-        return cls.build_op_definition().key
+        return cls._cached_op_definition().key
 
     def list_matching_io_samplings(self) -> List[Tuple[str, str]]:
         """List pairs of input/output pairs with the same sampling.
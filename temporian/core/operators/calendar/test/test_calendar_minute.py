@@ -42,6 +42,42 @@ class CalendarMinuteTest(TestCase):
         result = evset.calendar_minute()
         assertOperatorResult(self, result, expected)
 
+    def test_timezone_and_negative_timestamps(self):
+        timestamps = [-3601.5, -61.0, -0.5, 0.0, 59.9, 60.0, 5430.0]
+        evset = event_set(timestamps=timestamps, is_unix_timestamp=True)
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "calendar_minute": i32([29, 28, 29, 30, 30, 31, 0]),
+            },
+            is_unix_timestamp=True,
+            same_sampling_as=evset,
+        )
+
+        # UTC+5:30
+        result = evset.calendar_minute(tz=5.5)
+        assertOperatorResult(self, result, expected)
+
+    def test_sub_microsecond_timestamps(self):
+        # Timestamps are rounded to the microsecond, like in
+        # datetime.fromtimestamp. 599.9999995 is a tie, rounded to the even
+        # microsecond 599.999999.
+        timestamps = [59.9999994, 59.9999996, 599.9999995, 3599.9999996]
+        evset = event_set(timestamps=timestamps, is_unix_timestamp=True)
+
+        expected = event_set(
+            timestamps=timestamps,
+            features={
+                "calendar_minute": i32([0, 1, 9, 0]),
+            },
+            is_unix_timestamp=True,
+            same_sampling_as=evset,
+        )
+
+        result = evset.calendar_minute()
+        assertOperatorResult(self, result, expected)
+
 
 if __name__ == "__main__":
     absltest.main()
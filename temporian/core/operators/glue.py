@@ -14,6 +14,8 @@
 
 """Glue operator class and public API function definition."""
 
+from collections import Counter
+
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
 from temporian.core.data.node import (
@@ -43,32 +45,37 @@ class GlueOperator(Operator):
             raise ValueError("At least two arguments should be provided.")
 
         # inputs
-        output_features = []
-        output_feature_schemas = []
-        feature_names = set()
-        first_sampling_node = None
-
         for key, input in inputs.items():
             self.add_input(key, input)
 
+        input_list = list(inputs.values())
+        first_sampling_node = input_list[0]
+
+        output_features = []
+        output_feature_schemas = []
+        for input in input_list:
             output_features.extend(input.feature_nodes)
             output_feature_schemas.extend(input.schema.features)
 
-            for f in input.schema.features:
-                if f.name in feature_names:
-                    raise ValueError(
-                        f'Feature "{f.name}" is defined in multiple input'
-                        " EventSetNodes to glue. Consider using prefix() or"
-                        " rename()."
-                    )
-                feature_names.add(f.name)
-
-            if first_sampling_node is None:
-                first_sampling_node = input
-            else:
-                input.check_same_sampling(first_sampling_node)
+        feature_names = [f.name for f in output_feature_schemas]
+        if len(feature_names) != len(set(feature_names)):
+            duplicate_name = next(
+                name
+                for name, count in Counter(feature_names).items()
+                if count > 1
+            )
+            raise ValueError(
+                f'Feature "{duplicate_name}" is defined in multiple input'
+                " EventSetNodes to glue. Consider using prefix() or"
+                " rename()."
+            )
 
-        assert first_sampling_node is not None
+        # Nodes sharing the same sampling node also share the same indexes, so
+        # the full check is only needed when the samplings differ.
+        first_sampling = first_sampling_node.sampling_node
+        for input in input_list[1:]:
+            if input.sampling_node is not first_sampling:
+                input.check_same_sampling(first_sampling_node)
 
         self.add_output(
             "output",
@@ -78,7 +85,7 @@ class GlueOperator(Operator):
                     indexes=first_sampling_node.schema.indexes,
                     is_unix_timestamp=first_sampling_node.schema.is_unix_timestamp,
                 ),
-                sampling=first_sampling_node.sampling_node,
+                sampling=first_sampling,
                 features=output_features,
                 creator=self,
             ),
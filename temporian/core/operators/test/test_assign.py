@@ -20,6 +20,18 @@ from temporian.test.utils import assertOperatorResult
 
 
 class AssignTest(parameterized.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # EventSet shared by several tests. The tests only read it.
+        cls.timestamps = [1, 2, 3, 4, 5]
+        cls.evset_1 = event_set(
+            timestamps=cls.timestamps,
+            features={
+                "f": [1, 2, 3, 4, 5],
+            },
+        )
+
     def test_basic(self):
         timestamps = [1, 1, 2, 3, 4]
 
@@ -50,103 +62,65 @@ class AssignTest(parameterized.TestCase):
 
         assertOperatorResult(self, result, expected)
 
-    def test_multi(self):
-        timestamps = [1, 2, 3, 4, 5]
-
-        evset_1 = event_set(
-            timestamps=timestamps,
-            features={
-                "f": [1, 2, 3, 4, 5],
-            },
-        )
-        evset_2 = event_set(
-            timestamps=timestamps,
-            features={
-                "f": [21, 22, 23, 24, 25],
-            },
-            same_sampling_as=evset_1,
-        )
-
-        evset_3 = event_set(
-            timestamps=timestamps,
-            features={
-                "f": [31, 32, 33, 34, 35],
-            },
-            same_sampling_as=evset_1,
-        )
-        result = evset_1.assign(f2=evset_2, f3=evset_3)
-
-        expected = event_set(
-            timestamps=timestamps,
-            features={
+    @parameterized.named_parameters(
+        (
+            "multi",
+            {"f2": [21, 22, 23, 24, 25], "f3": [31, 32, 33, 34, 35]},
+            {
                 "f": [1, 2, 3, 4, 5],
                 "f2": [21, 22, 23, 24, 25],
                 "f3": [31, 32, 33, 34, 35],
             },
-            same_sampling_as=evset_1,
+        ),
+        (
+            "overwrite",
+            {"f": [21, 22, 23, 24, 25]},
+            {"f": [21, 22, 23, 24, 25]},
+        ),
+    )
+    def test_assign(self, assigned_features, expected_features):
+        others = {
+            name: event_set(
+                timestamps=self.timestamps,
+                features={"f": values},
+                same_sampling_as=self.evset_1,
+            )
+            for name, values in assigned_features.items()
+        }
+
+        result = self.evset_1.assign(**others)
+
+        expected = event_set(
+            timestamps=self.timestamps,
+            features=expected_features,
+            same_sampling_as=self.evset_1,
         )
         assertOperatorResult(self, result, expected)
 
     def test_multi_features(self):
-        timestamps = [1, 2, 3, 4, 5]
-
-        evset_1 = event_set(
-            timestamps=timestamps,
-            features={
-                "f": [1, 2, 3, 4, 5],
-            },
-        )
         evset_2 = event_set(
-            timestamps=timestamps,
+            timestamps=self.timestamps,
             features={
                 "f": [21, 22, 23, 24, 25],
                 "g": [31, 32, 33, 34, 35],
             },
-            same_sampling_as=evset_1,
+            same_sampling_as=self.evset_1,
         )
 
         with self.assertRaisesRegex(
             ValueError, "The assigned EventSets must have a single feature"
         ):
-            result = evset_1.assign(f2=evset_2)
+            result = self.evset_1.assign(f2=evset_2)
 
-        result = evset_1.assign(g2=evset_2["g"])
+        result = self.evset_1.assign(g2=evset_2["g"])
 
         expected = event_set(
-            timestamps=timestamps,
+            timestamps=self.timestamps,
             features={
                 "f": [1, 2, 3, 4, 5],
                 "g2": [31, 32, 33, 34, 35],
             },
-            same_sampling_as=evset_1,
-        )
-        assertOperatorResult(self, result, expected)
-
-    def test_overwrite(self):
-        timestamps = [1, 2, 3, 4, 5]
-
-        evset_1 = event_set(
-            timestamps=timestamps,
-            features={
-                "f": [1, 2, 3, 4, 5],
-            },
-        )
-        evset_2 = event_set(
-            timestamps=timestamps,
-            features={
-                "f": [21, 22, 23, 24, 25],
-            },
-            same_sampling_as=evset_1,
-        )
-
-        result = evset_1.assign(f=evset_2)
-
-        expected = event_set(
-            timestamps=timestamps,
-            features={
-                "f": [21, 22, 23, 24, 25],
-            },
-            same_sampling_as=evset_1,
+            same_sampling_as=self.evset_1,
         )
         assertOperatorResult(self, result, expected)
 
@@ -12,91 +12,133 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from typing import List, Optional, Tuple
+
+import numpy as np
 from absl.testing import absltest
-from absl.testing.parameterized import TestCase
+from absl.testing.parameterized import TestCase, parameters
 
+from temporian.core.data.dtype import DType
+from temporian.core.data.schema import Schema
+from temporian.implementation.numpy.data.event_set import EventSet, IndexData
 from temporian.implementation.numpy.data.io import event_set
-from temporian.test.utils import assertOperatorResult
-
-
-class DropIndexTest(TestCase):
-    def setUp(self) -> None:
-        self.timestamps = [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8]
-        self.features = {
-            "a": ["A", "A", "A", "B", "B", "B", "B", "B"],
-            "b": [0, 0, 0, 0, 0, 1, 1, 1],
-            "c": [1, 1, 1, 2, 2, 2, 2, 3],
-            "d": [10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0],
-        }
-        self.evset = event_set(
-            timestamps=self.timestamps,
-            features=self.features,
-            indexes=["b", "c"],
-        )
-
-    def test_drop_all(self) -> None:
-        expected = event_set(
-            timestamps=self.timestamps,
-            # Old indexes are now the last features
-            features={
-                "a": self.features["a"],
-                "d": self.features["d"],
-                "b": self.features["b"],
-                "c": self.features["c"],
-            },
-        )
-
-        result = self.evset.drop_index()
-
-        assertOperatorResult(self, result, expected, check_sampling=False)
-
-    def test_drop_single_first(self) -> None:
-        expected = event_set(
-            timestamps=self.timestamps,
-            # Old indexes are now the last features
-            features={
-                "c": self.features["c"],
-                "a": self.features["a"],
-                "d": self.features["d"],
-                "b": self.features["b"],
-            },
-            indexes=["c"],
+from temporian.test.utils import assertOperatorResult, f64, i64
+
+
+# Data of the input EventSet, used to build the expected outputs.
+_TIMESTAMPS = f64([0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8])
+_FEATURES = {
+    "a": ["A", "A", "A", "B", "B", "B", "B", "B"],
+    "b": i64([0, 0, 0, 0, 0, 1, 1, 1]),
+    "c": i64([1, 1, 1, 2, 2, 2, 2, 3]),
+    "d": f64([10.0, 11.0, 12.0, 13.0, 14.0, 15.0, 16.0, 17.0]),
+}
+
+
+def _expected_evset(
+    features: List[str], indexes: Optional[List[str]] = None
+) -> EventSet:
+    """Builds an expected output from the input data.
+
+    Called when the test parameters are defined, so each expected EventSet
+    is built once at import.
+    """
+    return event_set(
+        timestamps=_TIMESTAMPS,
+        features={name: _FEATURES[name] for name in features},
+        indexes=indexes,
+    )
+
+
+# Input EventSet, i.e. the data above indexed by "b" and "c". Built directly
+# with its per-index data to avoid running add_index.
+_INPUT_SCHEMA = Schema(
+    features=[("a", DType.STRING), ("d", DType.FLOAT64)],
+    indexes=[("b", DType.INT64), ("c", DType.INT64)],
+    is_unix_timestamp=False,
+)
+_INPUT_EVSET = EventSet(
+    data={
+        (0, 1): IndexData(
+            features=[np.array([b"A", b"A", b"A"]), f64([10.0, 11.0, 12.0])],
+            timestamps=f64([0.1, 0.2, 0.3]),
+            schema=_INPUT_SCHEMA,
+        ),
+        (0, 2): IndexData(
+            features=[np.array([b"B", b"B"]), f64([13.0, 14.0])],
+            timestamps=f64([0.4, 0.5]),
+            schema=_INPUT_SCHEMA,
+        ),
+        (1, 2): IndexData(
+            features=[np.array([b"B", b"B"]), f64([15.0, 16.0])],
+            timestamps=f64([0.6, 0.7]),
+            schema=_INPUT_SCHEMA,
+        ),
+        (1, 3): IndexData(
+            features=[np.array([b"B"]), f64([17.0])],
+            timestamps=f64([0.8]),
+            schema=_INPUT_SCHEMA,
+        ),
+    },
+    schema=_INPUT_SCHEMA,
+)
+
+
+def _fingerprint(evset: EventSet) -> Tuple:
+    """Gets a snapshot of the raw data of an EventSet."""
+    return tuple(
+        (
+            index_key,
+            index_data.timestamps.tobytes(),
+            tuple(feature.tobytes() for feature in index_data.features),
         )
+        for index_key, index_data in evset.data.items()
+    )
 
-        result = self.evset.drop_index("b")
 
-        assertOperatorResult(self, result, expected, check_sampling=False)
-
-    def test_drop_single_second(self) -> None:
-        expected = event_set(
-            timestamps=self.timestamps,
-            # Old indexes are now the last features
-            features={
-                "b": self.features["b"],
-                "a": self.features["a"],
-                "d": self.features["d"],
-                "c": self.features["c"],
-            },
-            indexes=["b"],
+class DropIndexTest(TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls._input_fingerprint = _fingerprint(_INPUT_EVSET)
+
+    def tearDown(self) -> None:
+        # Operators must not modify their inputs, since _INPUT_EVSET is shared
+        # by all the tests without defensive copies.
+        self.assertEqual(_fingerprint(_INPUT_EVSET), self._input_fingerprint)
+        super().tearDown()
+
+    def test_input_matches_flat_data(self) -> None:
+        # _INPUT_EVSET is built by hand and must stay in sync with the data
+        # used to build the expected outputs.
+        self.assertEqual(
+            _INPUT_EVSET,
+            event_set(
+                timestamps=_TIMESTAMPS, features=_FEATURES, indexes=["b", "c"]
+            ),
         )
 
-        result = self.evset.drop_index("c")
-
-        assertOperatorResult(self, result, expected, check_sampling=False)
-
-    def test_drop_single_keep_false(self) -> None:
-        expected = event_set(
-            timestamps=self.timestamps,
+    @parameters(
+        {  # drop all
+            "drop_kwargs": {},
             # Old indexes are now the last features
-            features={
-                "b": self.features["b"],
-                "a": self.features["a"],
-                "d": self.features["d"],
-            },
-            indexes=["b"],
-        )
-
-        result = self.evset.drop_index("c", keep=False)
+            "expected": _expected_evset(["a", "d", "b", "c"]),
+        },
+        {  # drop single first
+            "drop_kwargs": {"indexes": "b"},
+            "expected": _expected_evset(["c", "a", "d", "b"], indexes=["c"]),
+        },
+        {  # drop single second
+            "drop_kwargs": {"indexes": "c"},
+            "expected": _expected_evset(["b", "a", "d", "c"], indexes=["b"]),
+        },
+        {  # drop single keep false
+            "drop_kwargs": {"indexes": "c", "keep": False},
+            "expected": _expected_evset(["b", "a", "d"], indexes=["b"]),
+        },
+    )
+    def test_drop(self, drop_kwargs, expected) -> None:
+        result = _INPUT_EVSET.drop_index(**drop_kwargs)
 
         assertOperatorResult(self, result, expected, check_sampling=False)
 
@@ -124,13 +166,13 @@ class DropIndexTest(TestCase):
 
     def test_wrong_index(self):
         with self.assertRaisesRegex(ValueError, "x is not an index in"):
-            self.evset.drop_index("x")
+            _INPUT_EVSET.drop_index("x")
 
     def test_empty_list(self):
         with self.assertRaisesRegex(
             ValueError, "Cannot specify empty list as `indexes` argument"
         ):
-            self.evset.drop_index([])
+            _INPUT_EVSET.drop_index([])
 
 
 if __name__ == "__main__":
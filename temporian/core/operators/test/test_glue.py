@@ -92,6 +92,18 @@ class GlueTest(TestCase):
             )
             glue(evset_1, evset_2)
 
+    def test_duplicate_feature_non_adjacent_inputs(self):
+        evset_1 = event_set([0], features={"a": [1], "b": [2]})
+        evset_2 = event_set([0], features={"c": [3]}, same_sampling_as=evset_1)
+        evset_3 = event_set(
+            [0], features={"d": [4], "b": [5]}, same_sampling_as=evset_1
+        )
+        with self.assertRaisesRegex(
+            ValueError,
+            'Feature "b" is defined in multiple input EventSetNodes',
+        ):
+            glue(evset_1, evset_2, evset_3)
+
     def test_no_evsets(self):
         with self.assertRaisesRegex(
             ValueError,
@@ -12,43 +12,50 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import math
-
+import numpy as np
 from absl.testing import absltest
 from absl.testing.parameterized import TestCase
 
 from temporian.implementation.numpy.data.io import event_set
-from temporian.test.utils import assertOperatorResult
+from temporian.test.utils import assertOperatorResult, f64, i64
+
+
+# Input EventSet, sampling, and expected resampled EventSet of test_basic.
+_TIMESTAMPS = f64([1, 5, 8, 9, 1, 1])
+_FEATURES = {
+    "a": f64([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]),
+    "b": i64([5, 6, 7, 8, 9, 10]),
+    "c": ["A", "B", "C", "D", "E", "F"],
+    "x": i64([1, 1, 1, 1, 2, 2]),
+}
+_SAMPLING_TIMESTAMPS = f64([-1, 1, 6, 10, 2, 2, 1])
+_SAMPLING_FEATURES = {"x": i64([1, 1, 1, 1, 2, 2, 3])}
+_EXPECTED_FEATURES = {
+    "a": f64([np.nan, 1.0, 2.0, 4.0, 6.0, 6.0, np.nan]),
+    "b": i64([0, 5, 6, 8, 10, 10, 0]),
+    "c": ["", "A", "B", "D", "F", "F", ""],
+    "x": i64([1, 1, 1, 1, 2, 2, 3]),
+}
 
 
 class ResampleTest(TestCase):
     def test_basic(self):
         evset = event_set(
-            timestamps=[1, 5, 8, 9, 1, 1],
-            features={
-                "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
-                "b": [5, 6, 7, 8, 9, 10],
-                "c": ["A", "B", "C", "D", "E", "F"],
-                "x": [1, 1, 1, 1, 2, 2],
-            },
+            timestamps=_TIMESTAMPS,
+            features=_FEATURES,
             indexes=["x"],
         )
         sampling = event_set(
-            timestamps=[-1, 1, 6, 10, 2, 2, 1],
-            features={"x": [1, 1, 1, 1, 2, 2, 3]},
+            timestamps=_SAMPLING_TIMESTAMPS,
+            features=_SAMPLING_FEATURES,
             indexes=["x"],
         )
 
         result = evset.resample(sampling)
 
         expected = event_set(
-            timestamps=[-1, 1, 6, 10, 2, 2, 1],
-            features={
-                "a": [math.nan, 1.0, 2.0, 4.0, 6.0, 6.0, math.nan],
-                "b": [0, 5, 6, 8, 10, 10, 0],
-                "c": ["", "A", "B", "D", "F", "F", ""],
-                "x": [1, 1, 1, 1, 2, 2, 3],
-            },
+            timestamps=_SAMPLING_TIMESTAMPS,
+            features=_EXPECTED_FEATURES,
             indexes=["x"],
             same_sampling_as=sampling,
         )
@@ -14,8 +14,7 @@
 
 """Unary operators (e.g: ~, isnan, abs) and public API definitions."""
 
-from abc import abstractmethod
-from typing import List
+from typing import ClassVar, FrozenSet, List, Optional, Tuple
 
 from temporian.core import operator_lib
 from temporian.core.compilation import compile
@@ -24,30 +23,46 @@ from temporian.core.data.node import (
     EventSetNode,
     create_node_new_features_existing_sampling,
 )
+from temporian.core.data.schema import FeatureSchema
 from temporian.core.operators.base import Operator
 from temporian.core.typing import EventSetOrNode
 from temporian.proto import core_pb2 as pb
 
 
 class BaseUnaryOperator(Operator):
+    """Interface definition and common code for unary operators."""
+
+    # Op. key used for serialization in build_op_definition.
+    DEF_KEY: ClassVar[str] = ""
+
+    # DTypes that should work with this operator.
+    ALLOWED_DTYPES: ClassVar[FrozenSet[DType]] = frozenset()
+
+    # DType of all the output features. If None, each output feature has the
+    # dtype of the corresponding input feature.
+    OUTPUT_DTYPE: ClassVar[Optional[DType]] = None
+
     def __init__(
         self,
         input: EventSetNode,
     ):
         super().__init__()
 
-        # Check input
-        if not isinstance(input, EventSetNode):
+        # Check input. The public API functions are compiled, so they always
+        # pass an EventSetNode. The check is only useful when the operator is
+        # instantiated directly, and is skipped when running with `python -O`.
+        if __debug__ and not isinstance(input, EventSetNode):
             raise TypeError(
                 f"Input must be of type EventSetNode but got {type(input)}"
             )
 
+        allowed_dtypes = self.ALLOWED_DTYPES
         for feature in input.schema.features:
-            if feature.dtype not in self.allowed_dtypes():
+            if feature.dtype not in allowed_dtypes:
                 raise ValueError(
                     "DTypes supported by the operator:"
-                    f" {self.allowed_dtypes()}. Got feature {feature.name} with"
-                    f" dtype {feature.dtype}."
+                    f" {sorted(allowed_dtypes, key=str)}. Got feature"
+                    f" {feature.name} with dtype {feature.dtype}."
                 )
 
         self.add_input("input", input)
@@ -55,10 +70,7 @@ class BaseUnaryOperator(Operator):
         self.add_output(
             "output",
             create_node_new_features_existing_sampling(
-                features=[
-                    (feature.name, self.get_output_dtype(feature.dtype))
-                    for feature in input.schema.features
-                ],
+                features=self._build_output_features(input.schema.features),
                 sampling_node=input,
                 creator=self,
             ),
@@ -68,7 +80,7 @@ class BaseUnaryOperator(Operator):
     @classmethod
     def build_op_definition(cls) -> pb.OperatorDef:
         return pb.OperatorDef(
-            key=cls.op_key_definition(),
+            key=cls.DEF_KEY,
             attributes=[],
             inputs=[
                 pb.OperatorDef.Input(key="input"),
@@ -77,224 +89,151 @@ class BaseUnaryOperator(Operator):
         )
 
     @classmethod
-    @abstractmethod
-    def op_key_definition(cls) -> str:
-        """Gets the op. key used for serialization in build_op_definition."""
+    def _build_output_features(
+        cls, input_features: List[FeatureSchema]
+    ) -> List[Tuple[str, DType]]:
+        """Gets the output features from the input features.
 
-    @classmethod
-    @abstractmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        """Gets the dtypes that should work with this operator."""
-
-    @classmethod
-    @abstractmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        """Gets the output DType from the input feature DType."""
+        If OUTPUT_DTYPE is None, the output features have the same dtypes as
+        the input features.
+        """
+        output_dtype = cls.OUTPUT_DTYPE
+        if output_dtype is None:
+            return [(feature.name, feature.dtype) for feature in input_features]
+        return [(feature.name, output_dtype) for feature in input_features]
 
 
 class InvertOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "INVERT"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [DType.BOOLEAN]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return DType.BOOLEAN
+    DEF_KEY = "INVERT"
+    ALLOWED_DTYPES = frozenset({DType.BOOLEAN})
+    OUTPUT_DTYPE = DType.BOOLEAN
 
 
 class IsNanOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "IS_NAN"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "IS_NAN"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.BOOLEAN,
             DType.FLOAT32,
             DType.FLOAT64,
             DType.INT32,
             DType.INT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return DType.BOOLEAN
+        }
+    )
+    OUTPUT_DTYPE = DType.BOOLEAN
 
 
 class NotNanOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "NOT_NAN"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "NOT_NAN"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.BOOLEAN,
             DType.FLOAT32,
             DType.FLOAT64,
             DType.INT32,
             DType.INT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return DType.BOOLEAN
+        }
+    )
+    OUTPUT_DTYPE = DType.BOOLEAN
 
 
 class AbsOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "ABS"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "ABS"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
             DType.INT32,
             DType.INT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
+        }
+    )
 
 
 class LogOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "LOG"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "LOG"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
+        }
+    )
 
 
 class SinOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "SIN"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "SIN"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
+        }
+    )
 
 
 class CosOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "COS"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "COS"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
+        }
+    )
 
 
 class TanOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "TAN"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "TAN"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
+        }
+    )
 
 
 class ArcSinOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "ARCSIN"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "ARCSIN"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
+        }
+    )
 
 
 class ArcCosOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "ARCCOS"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "ARCCOS"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
+        }
+    )
 
 
 class ArcTanOperator(BaseUnaryOperator):
-    @classmethod
-    def op_key_definition(cls) -> str:
-        return "ARCTAN"
-
-    @classmethod
-    def allowed_dtypes(cls) -> List[DType]:
-        return [
+    DEF_KEY = "ARCTAN"
+    ALLOWED_DTYPES = frozenset(
+        {
             DType.FLOAT32,
             DType.FLOAT64,
-        ]
-
-    @classmethod
-    def get_output_dtype(cls, feature_dtype: DType) -> DType:
-        return feature_dtype
-
-
-operator_lib.register_operator(InvertOperator)
-operator_lib.register_operator(IsNanOperator)
-operator_lib.register_operator(NotNanOperator)
-operator_lib.register_operator(AbsOperator)
-operator_lib.register_operator(LogOperator)
-operator_lib.register_operator(SinOperator)
-operator_lib.register_operator(CosOperator)
-operator_lib.register_operator(TanOperator)
-operator_lib.register_operator(ArcSinOperator)
-operator_lib.register_operator(ArcCosOperator)
-operator_lib.register_operator(ArcTanOperator)
+        }
+    )
+
+
+operator_lib.register_operators(
+    [
+        InvertOperator,
+        IsNanOperator,
+        NotNanOperator,
+        AbsOperator,
+        LogOperator,
+        SinOperator,
+        CosOperator,
+        TanOperator,
+        ArcSinOperator,
+        ArcCosOperator,
+        ArcTanOperator,
+    ]
+)
 
 
 @compile
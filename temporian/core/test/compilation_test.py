@@ -29,12 +29,15 @@ from temporian.core import evaluation
 # TODO: add more extensive tests
 # see https://github.com/google/temporian/pull/167#discussion_r1251164852
 class CompileTest(absltest.TestCase):
-    def setUp(self):
-        self.evset = event_set(
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # The tests only read these EventSets, so they are shared.
+        cls.evset = event_set(
             timestamps=[1.0, 2.0, 3.0],
             features={"a": [100.0, 200.0, 300.0]},
         )
-        self.other_evset = event_set(
+        cls.other_evset = event_set(
             timestamps=[1.0, 2.0, 3.0],
             features={"b": [100.0, 200.0, 300.0]},
         )
@@ -0,0 +1,60 @@
+# Copyright 2021 Google LLC.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Tests the operator registration mechanism."""
+
+from absl.testing import absltest
+
+from temporian.core import operator_lib
+from temporian.core.test import utils
+
+
+class OperatorLibTest(absltest.TestCase):
+    def tearDown(self):
+        operator_lib._unregister_operator(utils.OpI1O1)
+        operator_lib._unregister_operator(utils.OpI2O1)
+        super().tearDown()
+
+    def test_register_operators(self):
+        operator_lib.register_operators([utils.OpI1O1, utils.OpI2O1])
+        self.assertIs(operator_lib.get_operator_class("OpI1O1"), utils.OpI1O1)
+        self.assertIs(operator_lib.get_operator_class("OpI2O1"), utils.OpI2O1)
+
+    def test_register_operator(self):
+        operator_lib.register_operator(utils.OpI1O1)
+        self.assertIs(operator_lib.get_operator_class("OpI1O1"), utils.OpI1O1)
+
+        with self.assertRaisesRegex(ValueError, "Operator already registered"):
+            operator_lib.register_operator(utils.OpI1O1)
+
+    def test_register_operators_duplicate_in_batch(self):
+        with self.assertRaisesRegex(ValueError, "Operator already registered"):
+            operator_lib.register_operators([utils.OpI1O1, utils.OpI1O1])
+        self.assertNotIn("OpI1O1", operator_lib.registered_operators())
+
+    def test_register_operators_already_registered(self):
+        operator_lib.register_operator(utils.OpI1O1)
+        before = dict(operator_lib.registered_operators())
+
+        with self.assertRaisesRegex(ValueError, "Operator already registered"):
+            operator_lib.register_operators([utils.OpI2O1, utils.OpI1O1])
+
+        # None of the batch is registered.
+        self.assertEqual(operator_lib.registered_operators(), before)
+        self.assertNotIn("OpI2O1", operator_lib.registered_operators())
+
+
+if __name__ == "__main__":
+    absltest.main()
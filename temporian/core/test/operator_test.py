@@ -154,6 +154,22 @@ class OperatorTest(absltest.TestCase):
         ):
             t.check()
 
+    def test_definition_is_shared(self):
+        num_builds = 0
+
+        class ToyOperator(base.Operator):
+            @classmethod
+            def build_op_definition(cls) -> pb.OperatorDef:
+                nonlocal num_builds
+                num_builds += 1
+                return pb.OperatorDef(key="TOY")
+
+        a = ToyOperator()
+        b = ToyOperator()
+        self.assertIs(a.definition, b.definition)
+        self.assertEqual(ToyOperator.operator_key(), "TOY")
+        self.assertEqual(num_builds, 1)
+
 
 if __name__ == "__main__":
     absltest.main()
@@ -141,6 +141,10 @@ class IndexData:
 
         for f1, f2 in zip(self.features, other.features):
             if f1.dtype.kind == "f":
+                # Byte-identical arrays (the common case when comparing an
+                # output with its expected value) skip the tolerance check.
+                if _same_bytes(f1, f2):
+                    continue
                 if not np.allclose(f1, f2, equal_nan=True):
                     return False
             else:
@@ -155,6 +159,21 @@ class IndexData:
         return len(self.timestamps)
 
 
+def _same_bytes(a: np.ndarray, b: np.ndarray) -> bool:
+    """Checks if two arrays have the same dtype, shape and memory content.
+
+    The arrays are not copied. Non-contiguous arrays are reported as different.
+    """
+
+    return (
+        a.dtype == b.dtype
+        and a.shape == b.shape
+        and a.flags.c_contiguous
+        and b.flags.c_contiguous
+        and np.array_equal(a.view(np.uint8), b.view(np.uint8))
+    )
+
+
 class EventSet(EventSetOperations):
     """Actual temporal data.
 
@@ -1,3 +1,5 @@
+from unittest import mock
+
 import numpy as np
 from absl.testing import absltest
 
@@ -44,6 +46,70 @@ class EventSetTest(absltest.TestCase):
         self.evset.set_index_value((2, b"world"), modified)
         self.assertEqual(self.evset.get_index_value((2, b"world")), modified)
 
+    def test_index_data_eq_float_features(self):
+        timestamps = np.array([0.1, 0.2, 0.3])
+        index_data = IndexData(
+            features=[np.array([1.0, np.nan, 3.0])], timestamps=timestamps
+        )
+        # Identical data.
+        self.assertEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0, np.nan, 3.0])], timestamps=timestamps
+            ),
+        )
+        # Close but not identical data.
+        self.assertEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0, np.nan, 3.0 + 1e-12])],
+                timestamps=timestamps,
+            ),
+        )
+        # Different data.
+        self.assertNotEqual(
+            index_data,
+            IndexData(
+                features=[np.array([1.0, np.nan, 4.0])], timestamps=timestamps
+            ),
+        )
+
+    def test_index_data_eq_float_features_fast_path(self):
+        timestamps = np.array([0.1, 0.2, 0.3])
+        index_data = IndexData(
+            features=[np.array([0.0, np.nan, 3.0])], timestamps=timestamps
+        )
+        with mock.patch.object(np, "allclose", wraps=np.allclose) as allclose:
+            # Byte-identical data does not need the tolerance check.
+            self.assertEqual(
+                index_data,
+                IndexData(
+                    features=[np.array([0.0, np.nan, 3.0])],
+                    timestamps=timestamps,
+                ),
+            )
+            allclose.assert_not_called()
+
+            # -0.0 and 0.0 have different bytes but are equal.
+            self.assertEqual(
+                index_data,
+                IndexData(
+                    features=[np.array([-0.0, np.nan, 3.0])],
+                    timestamps=timestamps,
+                ),
+            )
+            allclose.assert_called_once()
+
+            # Non-contiguous data is compared with the tolerance check.
+            self.assertEqual(
+                index_data,
+                IndexData(
+                    features=[np.array([0.0, 1.0, np.nan, 2.0, 3.0])[::2]],
+                    timestamps=timestamps,
+                ),
+            )
+            self.assertEqual(allclose.call_count, 2)
+
     def test_data_access(self):
         self.assertEqual(
             repr(self.evset.schema.features), "[('a', int64), ('b', int64)]"
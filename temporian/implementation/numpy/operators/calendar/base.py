@@ -39,14 +39,8 @@ class BaseCalendarNumpyImplementation(OperatorImplementation):
         # create destination EventSet
         dst_evset = EventSet(data={}, schema=output_schema)
         for index_key, index_data in sampling.data.items():
-            value = np.array(
-                [
-                    self._get_value_from_datetime(
-                        datetime.fromtimestamp(ts, tz=tzinfo)
-                    )
-                    for ts in index_data.timestamps
-                ],
-                dtype=np.int32,
+            value = self._get_value_from_timestamps(
+                index_data.timestamps, tzinfo
             )
 
             dst_evset.set_index_value(
@@ -57,6 +51,33 @@ class BaseCalendarNumpyImplementation(OperatorImplementation):
 
         return {"output": dst_evset}
 
+    def _get_value_from_timestamps(
+        self, timestamps: np.ndarray, tzinfo: timezone
+    ) -> np.ndarray:
+        """Gets the int32 calendar values of an array of unix timestamps.
+
+        The default implementation converts each timestamp to a datetime and
+        calls `_get_value_from_datetime`. Calendar operators that can be
+        expressed with arithmetic on the timestamps should override this
+        method with a vectorized implementation.
+
+        Args:
+            timestamps: Unix timestamps, in seconds.
+            tzinfo: Timezone in which the calendar values are computed.
+
+        Returns:
+            Int32 array with one value per timestamp.
+        """
+        return np.array(
+            [
+                self._get_value_from_datetime(
+                    datetime.fromtimestamp(ts, tz=tzinfo)
+                )
+                for ts in timestamps
+            ],
+            dtype=np.int32,
+        )
+
     @abstractmethod
     def _get_value_from_datetime(self, dt: datetime) -> int:
         """Gets the value of the datetime object that corresponds to each
@@ -65,7 +86,7 @@ class BaseCalendarNumpyImplementation(OperatorImplementation):
         For example, calendar_day_of_month will return the datetime's day, and
         calendar_hour its hour.
 
-        Returned value is converted to int32 by __call__.
+        Returned value is converted to int32 by `_get_value_from_timestamps`.
 
         Args:
             dt: Datetime to get the value from.
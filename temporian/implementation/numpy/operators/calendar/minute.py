@@ -12,7 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
 
 from temporian.core.operators.calendar.minute import (
     CalendarMinuteOperator,
@@ -29,6 +31,23 @@ class CalendarMinuteNumpyImplementation(BaseCalendarNumpyImplementation):
     def __init__(self, operator: CalendarMinuteOperator) -> None:
         super().__init__(operator)
 
+    def _get_value_from_timestamps(
+        self, timestamps: np.ndarray, tzinfo: timezone
+    ) -> np.ndarray:
+        # Leap seconds are not counted in unix time, so the minute is directly
+        # computed from the timestamps shifted to the local timezone. Like
+        # datetime.fromtimestamp, the fractional part of the timestamps is
+        # rounded (half to even) to the microsecond.
+        offset = tzinfo.utcoffset(None) // timedelta(microseconds=1)
+        microseconds, seconds = np.modf(timestamps)
+        microseconds *= 1e6
+        np.round(microseconds, out=microseconds)
+        microseconds += offset
+        seconds += np.floor_divide(microseconds, 1e6)
+        minutes = np.floor_divide(seconds, 60, out=seconds)
+        np.mod(minutes, 60, out=minutes)
+        return minutes.astype(np.int32)
+
     def _get_value_from_datetime(self, dt: datetime) -> int:
         return dt.minute
 
@@ -35,14 +35,13 @@ class BaseUnaryNumpyImplementation(OperatorImplementation):
             data={},
             schema=output_schema,
         )
+        # Bound once instead of being looked up for each feature of each index.
+        do_operation = self._do_operation
         for index_key, index_data in input.data.items():
             dst_evset.set_index_value(
                 index_key,
                 IndexData(
-                    [
-                        self._do_operation(feature)
-                        for feature in index_data.features
-                    ],
+                    list(map(do_operation, index_data.features)),
                     index_data.timestamps,
                     schema=output_schema,
                 ),
@@ -70,7 +69,10 @@ class IsNanNumpyImplementation(BaseUnaryNumpyImplementation):
 
 class NotNanNumpyImplementation(BaseUnaryNumpyImplementation):
     def _do_operation(self, feature: np.ndarray) -> np.ndarray:
-        return ~np.isnan(feature)
+        # Negated in place to avoid allocating a second boolean array.
+        output = np.isnan(feature)
+        np.logical_not(output, out=output)
+        return output
 
 
 class AbsNumpyImplementation(BaseUnaryNumpyImplementation):
@@ -68,15 +68,15 @@ def i64(l):
 def assertEqualEventSet(
     test: absltest.TestCase, result: EventSet, expected: EventSet
 ):
-    test.assertEqual(
-        result,
-        expected,
-        (
-            "\n==========\nRESULT:\n==========\n"
-            f"{result}"
-            "\n==========\nEXPECTED:\n==========\n"
-            f"{expected}"
-        ),
+    # The EventSets are only printed on failure, since formatting them walks
+    # over all their data.
+    if result == expected:
+        return
+    test.fail(
+        "\n==========\nRESULT:\n==========\n"
+        f"{result}"
+        "\n==========\nEXPECTED:\n==========\n"
+        f"{expected}"
     )
 
 